@@ -1,6 +1,6 @@
 # crm/filters.py
 import django_filters as filters
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from .models import Customer, Product, Order
 
 
@@ -13,6 +13,8 @@ class CustomerFilter(filters.FilterSet):
     created_at__lte = filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="lte")
     # Challenge: phone pattern (e.g., starts with +1)
     phone_pattern = filters.CharFilter(method="filter_phone_pattern")
+    # Ordering, e.g. orderBy: "-created_at,name"
+    order_by = filters.OrderingFilter(fields=("id", "name", "email", "created_at"))
 
     def filter_phone_pattern(self, queryset, name, value):
         # e.g., "+1"  -> numbers that start with +1
@@ -28,6 +30,7 @@ class CustomerFilter(filters.FilterSet):
             "created_at__gte",
             "created_at__lte",
             "phone_pattern",
+            "order_by",
         ]
 
 
@@ -38,10 +41,11 @@ class ProductFilter(filters.FilterSet):
     stock__gte = filters.NumberFilter(field_name="stock", lookup_expr="gte")
     stock__lte = filters.NumberFilter(field_name="stock", lookup_expr="lte")
     # Think: low stock (stock < 10) -> use stock__lte=9 in queries, already supported
+    order_by = filters.OrderingFilter(fields=("id", "name", "price", "stock"))
 
     class Meta:
         model = Product
-        fields = ["name", "price__gte", "price__lte", "stock__gte", "stock__lte"]
+        fields = ["name", "price__gte", "price__lte", "stock__gte", "stock__lte", "order_by"]
 
 
 class OrderFilter(filters.FilterSet):
@@ -51,13 +55,25 @@ class OrderFilter(filters.FilterSet):
     order_date__lte = filters.IsoDateTimeFilter(field_name="order_date", lookup_expr="lte")
     # Related lookups
     customer_name = filters.CharFilter(field_name="customer__name", lookup_expr="icontains")
-    product_name = filters.CharFilter(field_name="products__name", lookup_expr="icontains")
+    product_name = filters.CharFilter(method="filter_product_name")
     # Challenge: specific product id
     product_id = filters.NumberFilter(method="filter_product_id")
+    order_by = filters.OrderingFilter(
+        fields=("id", "order_date", "total_amount", ("customer__name", "customer_name"))
+    )
+
+    def filter_product_name(self, queryset, name, value):
+        # Correlated EXISTS instead of a JOIN so orders with several matching products
+        # aren't repeated, and the probe stops at the first match
+        if value:
+            matching = Product.objects.filter(orders=OuterRef("pk"), name__icontains=value)
+            return queryset.filter(Exists(matching))
+        return queryset
 
     def filter_product_id(self, queryset, name, value):
         if value is not None:
-            return queryset.filter(products__id=value).distinct()
+            # M2M rows are unique per (order, product), so one id cannot duplicate orders
+            return queryset.filter(products__id=value)
         return queryset
 
     class Meta:
@@ -70,4 +86,5 @@ class OrderFilter(filters.FilterSet):
             "customer_name",
             "product_name",
             "product_id",
+            "order_by",
         ]
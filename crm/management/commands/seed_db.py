@@ -16,7 +16,7 @@ class Command(BaseCommand):
         parser.add_argument(
             "--force",
             action="store_true",
-            help="Create entries even if some exist (idempotent get_or_create is still used).",
+            help="Update existing entries with the seed values (seeding is still idempotent).",
         )
         parser.add_argument(
             "--with-order",
@@ -42,25 +42,28 @@ class Command(BaseCommand):
             Product.objects.all().delete()
             Customer.objects.all().delete()
 
-        # Seed Customers (idempotent via get_or_create)
+        # Seed Customers (idempotent via bulk_create + ignore_conflicts)
         customers_data = [
             {"name": "Alice", "email": "alice@example.com", "phone": "+1234567890"},
             {"name": "Bob", "email": "bob@example.com", "phone": "123-456-7890"},
             {"name": "Carol", "email": "carol@example.com", "phone": None},
         ]
 
-        created_customers = []
-        for data in customers_data:
-            obj, created = Customer.objects.get_or_create(
-                email=data["email"],
-                defaults={"name": data["name"], "phone": data["phone"]},
-            )
-            if not created and force:
+        # Email is unique, so conflicting rows are skipped by the database
+        Customer.objects.bulk_create(
+            [Customer(**data) for data in customers_data],
+            ignore_conflicts=True,
+            batch_size=200,
+        )
+        by_email = Customer.objects.in_bulk(
+            [data["email"] for data in customers_data], field_name="email"
+        )
+        created_customers = [by_email[data["email"]] for data in customers_data]
+        if force:
+            for obj, data in zip(created_customers, customers_data):
                 obj.name = data["name"]
                 obj.phone = data["phone"]
-                obj.save(update_fields=["name", "phone"])
-                created = True  # treat as updated
-            created_customers.append(obj)
+            Customer.objects.bulk_update(created_customers, ["name", "phone"], batch_size=200)
 
         # Seed Products
         products_data = [
@@ -69,18 +72,21 @@ class Command(BaseCommand):
             {"name": "Keyboard", "price": Decimal("49.99"), "stock": 50},
         ]
 
-        created_products = []
-        for data in products_data:
-            obj, created = Product.objects.get_or_create(
-                name=data["name"],
-                defaults={"price": data["price"], "stock": data["stock"]},
-            )
-            if not created and force:
+        # Product.name is not unique, so look up existing names before inserting
+        data_by_name = {data["name"]: data for data in products_data}
+        existing = {p.name: p for p in Product.objects.filter(name__in=data_by_name)}
+        Product.objects.bulk_create(
+            [Product(**data) for name, data in data_by_name.items() if name not in existing],
+            batch_size=200,
+        )
+        if force:
+            for obj in existing.values():
+                data = data_by_name[obj.name]
                 obj.price = data["price"]
                 obj.stock = data["stock"]
-                obj.save(update_fields=["price", "stock"])
-                created = True
-            created_products.append(obj)
+            Product.objects.bulk_update(list(existing.values()), ["price", "stock"], batch_size=200)
+        by_name = {p.name: p for p in Product.objects.filter(name__in=data_by_name)}
+        created_products = [by_name[name] for name in data_by_name]
 
         self.stdout.write(self.style.SUCCESS(f"Customers ready: {len(created_customers)}"))
         self.stdout.write(self.style.SUCCESS(f"Products ready: {len(created_products)}"))
@@ -92,12 +98,13 @@ class Command(BaseCommand):
             customer = created_customers[0]
             products = created_products[:2]
 
-            order = Order.objects.create(customer=customer)
-            order.products.set(products)
-            # Compute total_amount precisely
+            # Compute total_amount precisely before the insert so no second save is needed
             total = sum((p.price for p in products), start=Decimal("0.00"))
-            order.total_amount = total
-            order.save(update_fields=["total_amount"])
+            order = Order.objects.create(customer=customer, total_amount=total)
+            Through = Order.products.through
+            Through.objects.bulk_create(
+                [Through(order_id=order.id, product_id=p.id) for p in products]
+            )
 
             self.stdout.write(
                 self.style.SUCCESS(
@@ -0,0 +1,27 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crm", "0002_trigram_indexes"),
+    ]
+
+    # Customer.created_at/updated_at were on the model but missing from 0001_initial.
+    # Existing rows have no creation time on record, so they get the migration time.
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="customer",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
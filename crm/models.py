@@ -1,6 +1,7 @@
 
 from decimal import Decimal
 from django.db import models
+from django.db.models import Sum
 from django.utils import timezone
 from django.core.validators import MinValueValidator
 
@@ -11,6 +12,11 @@ class Customer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at"], name="crm_customer_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.name} <{self.email}>"
 
@@ -20,6 +26,12 @@ class Product(models.Model):
                                 validators=[MinValueValidator(Decimal("0.01"))])
     stock = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["price"], name="crm_product_price_idx"),
+            models.Index(fields=["stock"], name="crm_product_stock_idx"),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.price})"
 
@@ -29,9 +41,17 @@ class Order(models.Model):
     total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
     order_date = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-order_date"], name="crm_order_date_idx"),
+            models.Index(fields=["customer", "-order_date"], name="crm_order_cust_date_idx"),
+            models.Index(fields=["total_amount"], name="crm_order_total_idx"),
+        ]
+
     def __str__(self):
         return f"Order #{self.id} - {self.customer.name}"
     def save(self, *args, **kwargs):
-        if not self.total_amount:
-            self.total_amount = sum(product.price for product in self.products.all())
+        # M2M rows can only exist once the order has a primary key
+        if not self.total_amount and self.pk is not None:
+            self.total_amount = self.products.aggregate(s=Sum("price"))["s"] or Decimal("0.00")
         super().save(*args, **kwargs)
@@ -1,11 +1,13 @@
 import re
 from decimal import Decimal
-from django.db import transaction
-from django.db.models import Sum
+from functools import lru_cache
+from django.db import DatabaseError, transaction
+from django.db.models import Prefetch
 from django.utils import timezone
 
 import graphene
 from graphene_django import DjangoObjectType
+from graphql.language.ast import FragmentSpreadNode, InlineFragmentNode
 
 from .models import Customer, Product, Order
 
@@ -49,13 +51,78 @@ class OrderInput(graphene.InputObjectType):
 
 
 # ============ Helpers ============
+# GraphQL field name -> model column, per type reachable from an order
+_ORDER_COLUMNS = {"totalAmount": "total_amount", "orderDate": "order_date"}
+_CUSTOMER_COLUMNS = {
+    "name": "name", "email": "email", "phone": "phone", "createdAt": "created_at",
+}
+_PRODUCT_COLUMNS = {"name": "name", "price": "price", "stock": "stock"}
+
+
+def _selection_paths(selection_set, fragments, prefix=""):
+    for sel in selection_set.selections:
+        if isinstance(sel, FragmentSpreadNode):
+            yield from _selection_paths(fragments[sel.name.value].selection_set, fragments, prefix)
+        elif isinstance(sel, InlineFragmentNode):
+            yield from _selection_paths(sel.selection_set, fragments, prefix)
+        else:
+            path = prefix + sel.name.value
+            yield path
+            if sel.selection_set:
+                yield from _selection_paths(sel.selection_set, fragments, path + ".")
+
+
+def _requested_paths(info):
+    """Sorted dotted field paths selected under this field, with connection
+    ``edges.node`` wrappers flattened away (e.g. ``("customer", "customer.name")``)."""
+    paths = set()
+    for node in info.field_nodes:
+        if node.selection_set:
+            paths.update(
+                p.replace("edges.node.", "")
+                for p in _selection_paths(node.selection_set, info.fragments)
+            )
+    return tuple(sorted(paths))
+
+
+@lru_cache(maxsize=256)
+def _order_plan(paths):
+    # Returns (only() fields, select_related() fields, product only() fields or None)
+    top = {p.split(".", 1)[0] for p in paths}
+    only = ["id"] + [col for key, col in _ORDER_COLUMNS.items() if key in top]
+    select = ()
+    if "customer" in top:
+        select = ("customer",)
+        only.append("customer__id")
+        only += [f"customer__{col}" for key, col in _CUSTOMER_COLUMNS.items() if f"customer.{key}" in paths]
+    products = None
+    if "products" in top:
+        products = ("id",) + tuple(col for key, col in _PRODUCT_COLUMNS.items() if f"products.{key}" in paths)
+    return tuple(only), select, products
+
+
+def _orders_queryset(info):
+    # Customer via JOIN, products in one extra query, both limited to the selected
+    # columns; the plan is memoized since API traffic repeats the same query shapes
+    only, select, products = _order_plan(_requested_paths(info))
+    qs = Order.objects.only(*only)
+    # A bare select_related() would follow every FK, so only call it with fields
+    if select:
+        qs = qs.select_related(*select)
+    if products is not None:
+        qs = qs.prefetch_related(Prefetch("products", queryset=Product.objects.only(*products)))
+    return qs
+
+
 PHONE_RE = re.compile(r'^(\+\d{7,15}|\d{3}-\d{3}-\d{4})$')
+_PHONE_PREFIX = frozenset("+0123456789")
 
 
 def _valid_phone(phone: str) -> bool:
     if not phone:
         return True
-    return bool(PHONE_RE.match(phone))
+    # Cheap first-character reject before running the regex
+    return phone[0] in _PHONE_PREFIX and PHONE_RE.match(phone) is not None
 
 
 # ============ Query ============
@@ -74,7 +141,7 @@ class Query(graphene.ObjectType):
         return Product.objects.all()
 
     def resolve_orders(self, info):
-        return Order.objects.select_related("customer").prefetch_related("products").all()
+        return _orders_queryset(info)
 
 
 # ============ Mutations ============
@@ -118,39 +185,62 @@ class BulkCreateCustomers(graphene.Mutation):
 
     @staticmethod
     def mutate(root, info, input):
-        created = []
         errors = []
+        valid = []
 
-        # Single outer transaction + savepoints per row for partial success
-        with transaction.atomic():
-            for idx, data in enumerate(input):
-                sp = transaction.savepoint()
+        # One lookup for every email in the batch instead of one per row
+        seen = set(
+            Customer.objects.filter(email__in=[d.email for d in input if d.email])
+            .values_list("email", flat=True)
+        )
+
+        # Validate every phone in one pass up front
+        phones_ok = list(map(_valid_phone, (d.phone for d in input)))
+        name_max = Customer._meta.get_field("name").max_length
+        email_max = Customer._meta.get_field("email").max_length
+
+        for idx, data in enumerate(input):
+            row_errs = []
+            if not data.name:
+                row_errs.append(f"Row {idx}: Name is required.")
+            elif len(data.name) > name_max:
+                row_errs.append(f"Row {idx}: Name must be at most {name_max} characters.")
+            if not data.email:
+                row_errs.append(f"Row {idx}: Email is required.")
+            elif len(data.email) > email_max:
+                row_errs.append(f"Row {idx}: Email must be at most {email_max} characters.")
+            elif data.email in seen:
+                row_errs.append(f"Row {idx}: Email already exists ({data.email}).")
+            if not phones_ok[idx]:
+                row_errs.append(f"Row {idx}: Invalid phone format ({data.phone}).")
+
+            if row_errs:
+                errors.extend(row_errs)
+                continue
+
+            seen.add(data.email)
+            valid.append((idx, data))
+
+        # Valid rows go in with a single INSERT. If that fails (e.g. a concurrent
+        # writer took one of the emails), retry row by row so the rest still land
+        created = []
+        try:
+            with transaction.atomic():
+                created = Customer.objects.bulk_create(
+                    [Customer(name=d.name, email=d.email, phone=d.phone or None) for _, d in valid],
+                    batch_size=200,
+                )
+        except DatabaseError:
+            for idx, data in valid:
                 try:
-                    row_errs = []
-                    if not data.name:
-                        row_errs.append(f"Row {idx}: Name is required.")
-                    if not data.email:
-                        row_errs.append(f"Row {idx}: Email is required.")
-                    elif Customer.objects.filter(email=data.email).exists():
-                        row_errs.append(f"Row {idx}: Email already exists ({data.email}).")
-                    if not _valid_phone(data.phone or ""):
-                        row_errs.append(f"Row {idx}: Invalid phone format ({data.phone}).")
-
-                    if row_errs:
-                        errors.extend(row_errs)
-                        transaction.savepoint_rollback(sp)
-                        continue
-
-                    c = Customer.objects.create(
-                        name=data.name,
-                        email=data.email,
-                        phone=data.phone or None,
-                    )
-                    created.append(c)
-                    transaction.savepoint_commit(sp)
-                except Exception as e:
+                    with transaction.atomic():
+                        created.append(Customer.objects.create(
+                            name=data.name,
+                            email=data.email,
+                            phone=data.phone or None,
+                        ))
+                except DatabaseError as e:
                     errors.append(f"Row {idx}: {str(e)}")
-                    transaction.savepoint_rollback(sp)
 
         return BulkCreateCustomers(customers=created, errors=errors)
 
@@ -200,30 +290,39 @@ class CreateOrder(graphene.Mutation):
 
     @staticmethod
     def mutate(root, info, input: OrderInput):
-        # Validate customer exists
+        # Validate customer exists; only the id is needed for the FK
         try:
-            customer = Customer.objects.get(pk=input.customer_id)
-        except Customer.DoesNotExist:
+            customer_id = int(input.customer_id)
+        except (TypeError, ValueError):
+            customer_id = None
+        if customer_id is None or not Customer.objects.filter(pk=customer_id).exists():
             return CreateOrder(order=None, errors=[f"Invalid customer ID: {input.customer_id}"])
 
         # Validate product list
         if not input.product_ids:
             return CreateOrder(order=None, errors=["At least one product must be selected."])
 
-        products_qs = Product.objects.filter(id__in=input.product_ids)
-        found_ids = set(str(p.id) for p in products_qs)
-        missing = [pid for pid in input.product_ids if str(pid) not in found_ids]
+        # Materialize once; the same dict drives validation, linking and the total
+        try:
+            wanted = {int(pid) for pid in input.product_ids}
+        except (TypeError, ValueError):
+            return CreateOrder(order=None, errors=["Invalid product ID(s): must be integers."])
+        products = Product.objects.in_bulk(wanted)
+        missing = sorted(wanted - products.keys())
         if missing:
             return CreateOrder(order=None, errors=[f"Invalid product ID(s): {', '.join(map(str, missing))}"])
 
-        # Create order atomically and compute total with Decimal-safe aggregation
+        # Create order atomically with the Decimal-safe total computed up front
         odt = input.order_date or timezone.now()
+        total = sum((p.price for p in products.values()), Decimal("0.00"))
         with transaction.atomic():
-            order = Order.objects.create(customer=customer, order_date=odt)
-            order.products.set(products_qs)
-            total = products_qs.aggregate(s=Sum("price"))["s"] or Decimal("0.00")
-            order.total_amount = total
-            order.save(update_fields=["total_amount"])
+            order = Order.objects.create(customer_id=customer_id, order_date=odt, total_amount=total)
+            # One INSERT into the through table; in_bulk keys are already unique
+            Through = Order.products.through
+            Through.objects.bulk_create(
+                [Through(order_id=order.id, product_id=pid) for pid in products],
+                batch_size=500,
+            )
 
         return CreateOrder(order=order, errors=[])
     
@@ -259,117 +358,26 @@ class OrderNode(DjangoObjectType):
         fields = ("id", "customer", "products", "total_amount", "order_date")
 
 
-# ---------- Optional "filter" input wrappers (for nicer API) ----------
-class CustomerFilterInput(graphene.InputObjectType):
-    nameIcontains = graphene.String()
-    emailIcontains = graphene.String()
-    createdAtGte = graphene.DateTime()
-    createdAtLte = graphene.DateTime()
-    phonePattern = graphene.String()  # e.g., "+1"
-
-
-class ProductFilterInput(graphene.InputObjectType):
-    nameIcontains = graphene.String()
-    priceGte = graphene.Float()
-    priceLte = graphene.Float()
-    stockGte = graphene.Int()
-    stockLte = graphene.Int()
-
-
-class OrderFilterInput(graphene.InputObjectType):
-    totalAmountGte = graphene.Float()
-    totalAmountLte = graphene.Float()
-    orderDateGte = graphene.DateTime()
-    orderDateLte = graphene.DateTime()
-    customerName = graphene.String()
-    productName = graphene.String()
-    productId = graphene.ID()
-
-
-def _apply_ordering(qs, order_by_list):
-    if order_by_list:
-        # Support multiple comma-separated or list values
-        if isinstance(order_by_list, str):
-            order_by_list = [order_by_list]
-        qs = qs.order_by(*order_by_list)
-    return qs
-
-
 # ---------- Query ----------
 class Query(graphene.ObjectType):
-    # Filtered, paginated connections (auto-args from FilterSets)
-    all_customers = DjangoFilterConnectionField(
-        CustomerNode,
-        filterset_class=CustomerFilter,
-        order_by=graphene.List(graphene.String),     # e.g., ["-created_at", "name"]
-        filter=CustomerFilterInput()                 # Optional convenience input
-    )
-    all_products = DjangoFilterConnectionField(
-        ProductNode,
-        filterset_class=ProductFilter,
-        order_by=graphene.List(graphene.String),
-        filter=ProductFilterInput()
-    )
-    all_orders = DjangoFilterConnectionField(
-        OrderNode,
-        filterset_class=OrderFilter,
-        order_by=graphene.List(graphene.String),
-        filter=OrderFilterInput()
-    )
+    # Filtered, paginated connections (auto-args from FilterSets, incl. orderBy);
+    # filtering and slicing run in SQL inside DjangoFilterConnectionField
+    all_customers = DjangoFilterConnectionField(CustomerNode, filterset_class=CustomerFilter)
+    all_products = DjangoFilterConnectionField(ProductNode, filterset_class=ProductFilter)
+    all_orders = DjangoFilterConnectionField(OrderNode, filterset_class=OrderFilter)
 
     # Keep your simple hello field (and any other fields you already had)
     hello = graphene.String(default_value="Hello, GraphQL!")
 
-    # Resolvers: allow either (1) auto-generated filter args or (2) our "filter" input wrapper,
-    # plus apply custom ordering.
+    # Resolvers only supply the base queryset; the connection applies the FilterSet
     def resolve_all_customers(self, info, **kwargs):
-        qs = Customer.objects.all()
-        # Apply "filter" input if provided (map to FilterSet keys)
-        filt = kwargs.pop("filter", None)
-        if filt:
-            data = {}
-            if filt.get("nameIcontains"): data["name"] = filt["nameIcontains"]
-            if filt.get("emailIcontains"): data["email"] = filt["emailIcontains"]
-            if filt.get("createdAtGte"): data["created_at__gte"] = filt["createdAtGte"]
-            if filt.get("createdAtLte"): data["created_at__lte"] = filt["createdAtLte"]
-            if filt.get("phonePattern"): data["phone_pattern"] = filt["phonePattern"]
-            from .filters import CustomerFilter
-            qs = CustomerFilter(data=data, queryset=qs).qs
-        # Custom ordering
-        qs = _apply_ordering(qs, kwargs.get("order_by"))
-        return qs
+        return Customer.objects.only("id", "name", "email", "phone", "created_at")
 
     def resolve_all_products(self, info, **kwargs):
-        qs = Product.objects.all()
-        filt = kwargs.pop("filter", None)
-        if filt:
-            data = {}
-            if filt.get("nameIcontains"): data["name"] = filt["nameIcontains"]
-            if filt.get("priceGte") is not None: data["price__gte"] = filt["priceGte"]
-            if filt.get("priceLte") is not None: data["price__lte"] = filt["priceLte"]
-            if filt.get("stockGte") is not None: data["stock__gte"] = filt["stockGte"]
-            if filt.get("stockLte") is not None: data["stock__lte"] = filt["stockLte"]
-            from .filters import ProductFilter
-            qs = ProductFilter(data=data, queryset=qs).qs
-        qs = _apply_ordering(qs, kwargs.get("order_by"))
-        return qs
+        return Product.objects.only("id", "name", "price", "stock")
 
     def resolve_all_orders(self, info, **kwargs):
-        qs = Order.objects.select_related("customer").prefetch_related("products").all()
-        filt = kwargs.pop("filter", None)
-        if filt:
-            data = {}
-            if filt.get("totalAmountGte") is not None: data["total_amount__gte"] = filt["totalAmountGte"]
-            if filt.get("totalAmountLte") is not None: data["total_amount__lte"] = filt["totalAmountLte"]
-            if filt.get("orderDateGte"): data["order_date__gte"] = filt["orderDateGte"]
-            if filt.get("orderDateLte"): data["order_date__lte"] = filt["orderDateLte"]
-            if filt.get("customerName"): data["customer_name"] = filt["customerName"]
-            if filt.get("productName"): data["product_name"] = filt["productName"]
-            if filt.get("productId"): data["product_id"] = filt["productId"]
-            from .filters import OrderFilter
-            qs = OrderFilter(data=data, queryset=qs).qs
-        qs = _apply_ordering(qs, kwargs.get("order_by"))
-        return qs
+        return _orders_queryset(info)
 
 
 class Mutation(graphene.ObjectType):
@@ -1,3 +1,262 @@
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from .models import Customer, Product, Order
+from .schema import schema
+
+
+class OrderQueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        laptop = Product.objects.create(name="Laptop", price=Decimal("999.99"), stock=10)
+        mouse = Product.objects.create(name="Mouse", price=Decimal("19.99"), stock=100)
+        for _ in range(3):
+            order = Order.objects.create(customer=customer, total_amount=Decimal("1019.98"))
+            order.products.set([laptop, mouse])
+
+    def execute(self, query):
+        with CaptureQueriesContext(connection) as ctx:
+            result = schema.execute(query)
+        self.assertIsNone(result.errors)
+        return result.data, [q["sql"] for q in ctx.captured_queries]
+
+    def test_without_customer_does_not_join_customer(self):
+        data, queries = self.execute("{ allOrders { edges { node { id totalAmount } } } }")
+        self.assertEqual(len(data["allOrders"]["edges"]), 3)
+        self.assertEqual(len(queries), 2)  # count + page
+        for sql in queries:
+            self.assertNotIn("crm_customer", sql)
+
+    def test_with_customer_joins_only_selected_columns(self):
+        data, queries = self.execute(
+            "{ allOrders { edges { node { id customer { name } } } } }"
+        )
+        self.assertEqual(data["allOrders"]["edges"][0]["node"]["customer"]["name"], "Alice")
+        self.assertEqual(len(queries), 2)
+        page_sql = queries[-1]
+        self.assertIn('JOIN "crm_customer"', page_sql)
+        self.assertIn('"crm_customer"."name"', page_sql)
+        self.assertNotIn('"crm_customer"."updated_at"', page_sql)
+        self.assertNotIn('"crm_customer"."email"', page_sql)
+
+    def test_nested_products_connection_is_prefetched(self):
+        data, queries = self.execute(
+            "{ allOrders { edges { node { id products { edges { node { name } } } } } } }"
+        )
+        for edge in data["allOrders"]["edges"]:
+            names = {e["node"]["name"] for e in edge["node"]["products"]["edges"]}
+            self.assertEqual(names, {"Laptop", "Mouse"})
+        self.assertEqual(len(queries), 3)  # count + page + one products prefetch
+        self.assertNotIn('"crm_product"."stock"', queries[-1])
+
+    def test_fragments_are_followed(self):
+        data, queries = self.execute(
+            """
+            { allOrders { edges { node { ...OrderFields } } } }
+            fragment OrderFields on OrderNode { id ... on OrderNode { customer { email } } }
+            """
+        )
+        self.assertEqual(
+            data["allOrders"]["edges"][0]["node"]["customer"]["email"], "alice@example.com"
+        )
+        self.assertEqual(len(queries), 2)
+        self.assertIn('"crm_customer"."email"', queries[-1])
+
+
+class ConnectionFilterArgumentTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        alice = Customer.objects.create(name="Alice", email="alice@example.com")
+        bob = Customer.objects.create(name="Bob", email="bob@example.com")
+        carol = Customer.objects.create(name="Carol", email="carol@example.com")
+        Customer.objects.filter(pk=alice.pk).update(created_at="2024-01-01T00:00:00Z")
+        Customer.objects.filter(pk=bob.pk).update(created_at="2025-01-01T00:00:00Z")
+        Customer.objects.filter(pk=carol.pk).update(created_at="2025-06-01T00:00:00Z")
+        Product.objects.create(name="Laptop", price=Decimal("999.99"), stock=10)
+        Product.objects.create(name="Mouse", price=Decimal("19.99"), stock=100)
+        Product.objects.create(name="Keyboard", price=Decimal("49.99"), stock=50)
+        for customer, total in ((alice, "10.00"), (bob, "50.00"), (carol, "75.00")):
+            Order.objects.create(customer=customer, total_amount=Decimal(total))
+
+    def nodes(self, query, field):
+        result = schema.execute(query)
+        self.assertIsNone(result.errors)
+        return [edge["node"] for edge in result.data[field]["edges"]]
+
+    def test_all_customers_created_at_range_and_order_by(self):
+        nodes = self.nodes(
+            '{ allCustomers(createdAt_Gte: "2025-01-01T00:00:00Z", orderBy: "-created_at")'
+            " { edges { node { name } } } }",
+            "allCustomers",
+        )
+        self.assertEqual([n["name"] for n in nodes], ["Carol", "Bob"])
+
+    def test_all_products_price_range_and_order_by(self):
+        nodes = self.nodes(
+            '{ allProducts(price_Gte: 20, price_Lte: 1000, orderBy: "-price")'
+            " { edges { node { name } } } }",
+            "allProducts",
+        )
+        self.assertEqual([n["name"] for n in nodes], ["Laptop", "Keyboard"])
+
+    def test_all_orders_total_range_and_order_by(self):
+        nodes = self.nodes(
+            '{ allOrders(totalAmount_Gte: 20, orderBy: "customer_name")'
+            " { edges { node { customer { name } } } } }",
+            "allOrders",
+        )
+        self.assertEqual([n["customer"]["name"] for n in nodes], ["Bob", "Carol"])
+
+    def test_order_by_id_is_allowed(self):
+        nodes = self.nodes(
+            '{ allProducts(orderBy: "-id") { edges { node { name } } } }', "allProducts"
+        )
+        self.assertEqual([n["name"] for n in nodes], ["Keyboard", "Mouse", "Laptop"])
+
+    def test_all_orders_product_name_returns_each_order_once(self):
+        laptop = Product.objects.get(name="Laptop")
+        bag = Product.objects.create(name="Laptop Bag", price=Decimal("39.99"), stock=5)
+        Order.objects.get(customer__name="Alice").products.set([laptop, bag])
+        Order.objects.get(customer__name="Bob").products.set([Product.objects.get(name="Mouse")])
+        with CaptureQueriesContext(connection) as ctx:
+            nodes = self.nodes(
+                '{ allOrders(productName: "laptop") { edges { node { customer { name } } } } }',
+                "allOrders",
+            )
+        self.assertEqual([n["customer"]["name"] for n in nodes], ["Alice"])
+        page_sql = ctx.captured_queries[-1]["sql"]
+        self.assertIn("EXISTS", page_sql)
+        self.assertNotIn("DISTINCT", page_sql)
+
+
+class CreateOrderMutationTests(TestCase):
+    MUTATION = """
+        mutation($customerId: ID!, $productIds: [ID]!) {
+          createOrder(input: {customerId: $customerId, productIds: $productIds}) {
+            order { totalAmount }
+            errors
+          }
+        }
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        cls.product = Product.objects.create(name="Mouse", price=Decimal("19.99"), stock=100)
+
+    def create_order(self, customer_id, product_ids):
+        result = schema.execute(
+            self.MUTATION,
+            variable_values={"customerId": customer_id, "productIds": product_ids},
+        )
+        self.assertIsNone(result.errors)
+        return result.data["createOrder"]
+
+    def test_creates_order_with_total(self):
+        data = self.create_order(str(self.customer.pk), [str(self.product.pk)])
+        self.assertEqual(data["errors"], [])
+        self.assertEqual(Decimal(data["order"]["totalAmount"]), Decimal("19.99"))
+
+    def test_non_numeric_customer_id_is_a_validation_error(self):
+        data = self.create_order("abc", [str(self.product.pk)])
+        self.assertIsNone(data["order"])
+        self.assertEqual(data["errors"], ["Invalid customer ID: abc"])
+
+    def test_non_numeric_product_id_is_a_validation_error(self):
+        data = self.create_order(str(self.customer.pk), ["abc"])
+        self.assertIsNone(data["order"])
+        self.assertEqual(data["errors"], ["Invalid product ID(s): must be integers."])
+
+
+class BulkCreateCustomersMutationTests(TestCase):
+    MUTATION = """
+        mutation($input: [CustomerInput]!) {
+          bulkCreateCustomers(input: $input) {
+            customers { id email }
+            errors
+          }
+        }
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Customer.objects.create(name="Alice", email="alice@example.com")
+
+    def bulk_create(self, rows):
+        result = schema.execute(self.MUTATION, variable_values={"input": rows})
+        self.assertIsNone(result.errors)
+        return result.data["bulkCreateCustomers"]
+
+    def test_partial_success_with_row_errors(self):
+        data = self.bulk_create([
+            {"name": "Alice Again", "email": "alice@example.com"},
+            {"name": "Bob", "email": "bob@example.com", "phone": "123-456-7890"},
+            {"name": "Bobby", "email": "bob@example.com"},
+            {"name": "Carol", "email": "carol@example.com", "phone": "not-a-phone"},
+            {"name": "Dave", "email": "dave@example.com", "phone": "+1234567890"},
+            {"name": "x" * 121, "email": "eve@example.com"},
+        ])
+        self.assertEqual(data["errors"], [
+            "Row 0: Email already exists (alice@example.com).",
+            "Row 2: Email already exists (bob@example.com).",
+            "Row 3: Invalid phone format (not-a-phone).",
+            "Row 5: Name must be at most 120 characters.",
+        ])
+        self.assertEqual(
+            [c["email"] for c in data["customers"]], ["bob@example.com", "dave@example.com"]
+        )
+        self.assertTrue(all(c["id"] for c in data["customers"]))
+        self.assertEqual(Customer.objects.count(), 3)
+
+    def test_failed_bulk_insert_falls_back_to_per_row_inserts(self):
+        with mock.patch.object(Customer.objects, "bulk_create", side_effect=IntegrityError("race")) as bulk:
+            data = self.bulk_create([
+                {"name": "Bob", "email": "bob@example.com"},
+                {"name": "Dave", "email": "dave@example.com"},
+            ])
+        bulk.assert_called_once()
+        self.assertEqual(data["errors"], [])
+        self.assertEqual(
+            [c["email"] for c in data["customers"]], ["bob@example.com", "dave@example.com"]
+        )
+        self.assertEqual(Customer.objects.count(), 3)
+
+
+class SeedDbCommandTests(TestCase):
+    def seed(self, *args):
+        call_command("seed_db", *args, stdout=StringIO())
+
+    def test_reseeding_is_idempotent(self):
+        self.seed("--with-order")
+        self.seed("--with-order")
+        self.assertEqual(Customer.objects.count(), 3)
+        self.assertEqual(Product.objects.count(), 3)
+        self.assertEqual(Order.objects.count(), 2)
+        order = Order.objects.first()
+        self.assertEqual(order.total_amount, Decimal("1019.98"))
+        self.assertEqual(
+            set(order.products.values_list("name", flat=True)), {"Laptop", "Mouse"}
+        )
+
+    def test_force_restores_seed_values(self):
+        self.seed()
+        Customer.objects.filter(email="alice@example.com").update(phone="+1999")
+        Product.objects.filter(name="Laptop").update(price=Decimal("1.00"))
+
+        self.seed()
+        self.assertEqual(Customer.objects.get(email="alice@example.com").phone, "+1999")
+        self.assertEqual(Product.objects.get(name="Laptop").price, Decimal("1.00"))
 
-# Create your tests here.
+        self.seed("--force")
+        self.assertEqual(Customer.objects.count(), 3)
+        self.assertEqual(Product.objects.count(), 3)
+        self.assertEqual(Customer.objects.get(email="alice@example.com").phone, "+1234567890")
+        self.assertEqual(Product.objects.get(name="Laptop").price, Decimal("999.99"))